@@ -3,23 +3,34 @@ from InquirerPy.base.control import Choice
 from .config_manager import load_presets, save_presets
 import subprocess
 
+MAIN_MENU_CHOICES = [
+    Choice("run", name="Run Preset"),
+    Choice("config", name="Configure Preset"),
+    Choice("exit", name="Exit"),
+]
+
+# select() defaults to None, so menus that should not open on Back pass a default
+BACK_CHOICE = Choice(value=None, name="Back")
+
+MANAGE_MENU_CHOICES = [
+    Choice("add", name="Add new preset"),
+    Choice("edit", name="Edit existing preset"),
+    Choice("remove", name="Remove preset"),
+    Choice("back", name="Back"),
+]
+
 def main_flow():
+    actions = {"run": run_preset, "config": configure_presets}
     while True:
         action = inquirer.select(
             message="Select an action:",
-            choices=[
-                Choice("run", name="Run Preset"),
-                Choice("config", name="Configure Preset"),
-                Choice("exit", name="Exit"),
-            ]
+            choices=MAIN_MENU_CHOICES
         ).execute()
         
-        if action == "run":
-            run_preset()
-        elif action == "config":
-            configure_presets()
-        else:
+        handler = actions.get(action)
+        if handler is None:
             break
+        handler()
 
 def run_preset():
     presets = load_presets()
@@ -28,7 +39,7 @@ def run_preset():
         return
         
     choices = [Choice(name=name, value=cmd) for name, cmd in presets.items()]
-    choices.append(Choice(value=None, name="Back"))
+    choices.append(BACK_CHOICE)
     
     selected_cmd = inquirer.select(
         message="Select a preset:",
@@ -39,25 +50,17 @@ def run_preset():
         subprocess.run(selected_cmd, shell=True)
 
 def configure_presets():
+    actions = {"add": add_preset, "edit": edit_preset, "remove": remove_preset}
     while True:
         action = inquirer.select(
             message="Manage presets:",
-            choices=[
-                Choice("add", name="Add new preset"),
-                Choice("edit", name="Edit existing preset"),
-                Choice("remove", name="Remove preset"),
-                Choice("back", name="Back"),
-            ]
+            choices=MANAGE_MENU_CHOICES
         ).execute()
         
-        if action == "add":
-            add_preset()
-        elif action == "edit":
-            edit_preset()
-        elif action == "remove":
-            remove_preset()
-        else:
+        handler = actions.get(action)
+        if handler is None:
             break
+        handler()
 
 def add_preset():
     name = inquirer.text(message="Preset name:").execute()
@@ -74,16 +77,18 @@ def edit_preset():
         
     name = inquirer.select(
         message="Select to edit:",
-        choices=list(presets.keys()) + ["Back"]
+        choices=[*presets, BACK_CHOICE],
+        default=next(iter(presets))
     ).execute()
     
-    if name != "Back":
+    if name is not None:
         new_command = inquirer.text(
             message=f"New command for '{name}':", 
             default=presets[name]
         ).execute()
-        presets[name] = new_command
-        save_presets(presets)
+        if new_command != presets[name]:
+            presets[name] = new_command
+            save_presets(presets)
 
 def remove_preset():
     presets = load_presets()
@@ -93,9 +98,10 @@ def remove_preset():
         
     name = inquirer.select(
         message="Select to remove:",
-        choices=list(presets.keys()) + ["Back"]
+        choices=[*presets, BACK_CHOICE],
+        default=next(iter(presets))
     ).execute()
     
-    if name != "Back":
+    if name is not None:
         del presets[name]
         save_presets(presets)